@@ -1,7 +1,9 @@
 """Analyzer for Skills and Subagents quality metrics."""
 
-from collections import defaultdict
+from bisect import bisect_left
+from collections import Counter
 from dataclasses import dataclass
+from operator import attrgetter
 
 from .loader import ToolExecution
 
@@ -16,8 +18,16 @@ BUILTIN_SUBAGENTS = {
     'claude-code-guide',
 }
 
+# Execution outcomes, used as indices into per-tool count lists
+SUCCESS = 0
+FAILURE = 1
+INCOMPLETE = 2
 
-@dataclass
+# Sort key for ToolQuality lists
+_by_success_rate = attrgetter('success_rate')
+
+
+@dataclass(slots=True)
 class ToolQuality:
     """Quality metrics for a single tool (skill or subagent)."""
     name: str
@@ -28,9 +38,12 @@ class ToolQuality:
     success_rate: float  # 0.0 to 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityStats:
-    """Quality statistics for skills and subagents."""
+    """Quality statistics for skills and subagents.
+
+    Both lists are sorted by success rate, worst first.
+    """
     skills: list[ToolQuality]
     subagents: list[ToolQuality]
 
@@ -43,8 +56,9 @@ class QualityStats:
         Returns:
             Tuple of (problematic_skills, problematic_subagents)
         """
-        problematic_skills = [s for s in self.skills if s.success_rate < threshold]
-        problematic_subagents = [s for s in self.subagents if s.success_rate < threshold]
+        # Lists are sorted, so the problematic tools are a prefix of each
+        problematic_skills = self.skills[:bisect_left(self.skills, threshold, key=_by_success_rate)]
+        problematic_subagents = self.subagents[:bisect_left(self.subagents, threshold, key=_by_success_rate)]
         return problematic_skills, problematic_subagents
 
 
@@ -61,54 +75,59 @@ def analyze_quality(
     Returns:
         QualityStats with success rates and counts for each tool.
     """
-    # Track counts by tool name
-    skills_data = defaultdict(lambda: {'success': 0, 'failure': 0, 'incomplete': 0})
-    subagents_data = defaultdict(lambda: {'success': 0, 'failure': 0, 'incomplete': 0})
+    # Display names by (project, name); most executions repeat a few pairs
+    name_cache: dict[tuple[str, str], str] = {}
+
+    def classify():
+        """Yield (is_skill, display_name, status) for each counted execution."""
+        for execution in executions:
+            if execution.tool_name == 'Skill':
+                is_skill = True
+                name = execution.tool_input.get('skill', 'unknown')
+            elif execution.tool_name == 'Task':
+                is_skill = False
+                name = execution.tool_input.get('subagent_type', '')
+                # Only count custom subagents (not built-in)
+                if not name or name in BUILTIN_SUBAGENTS:
+                    continue
+            else:
+                continue
 
-    for execution in executions:
-        if execution.tool_name == 'Skill':
-            skill_name = execution.tool_input.get('skill', 'unknown')
             if include_project_prefix:
-                display_name = f"[{execution.project}] {skill_name}"
+                key = (execution.project, name)
+                display_name = name_cache.get(key)
+                if display_name is None:
+                    display_name = name_cache[key] = f"[{execution.project}] {name}"
             else:
-                display_name = skill_name
+                display_name = name
 
             if not execution.has_result:
-                skills_data[display_name]['incomplete'] += 1
+                status = INCOMPLETE
             elif execution.is_error:
-                skills_data[display_name]['failure'] += 1
+                status = FAILURE
             else:
-                skills_data[display_name]['success'] += 1
-
-        elif execution.tool_name == 'Task':
-            subagent_type = execution.tool_input.get('subagent_type', '')
-            # Only count custom subagents (not built-in)
-            if subagent_type and subagent_type not in BUILTIN_SUBAGENTS:
-                if include_project_prefix:
-                    display_name = f"[{execution.project}] {subagent_type}"
-                else:
-                    display_name = subagent_type
-
-                if not execution.has_result:
-                    subagents_data[display_name]['incomplete'] += 1
-                elif execution.is_error:
-                    subagents_data[display_name]['failure'] += 1
-                else:
-                    subagents_data[display_name]['success'] += 1
+                status = SUCCESS
+
+            yield is_skill, display_name, status
+
+    # Count outcomes per (kind, name, status) in one pass
+    counts = Counter(classify())
+
+    # Group counts by tool name: [success, failure, incomplete]
+    skills_data: dict[str, list[int]] = {}
+    subagents_data: dict[str, list[int]] = {}
+    for (is_skill, display_name, status), count in counts.items():
+        tool_data = skills_data if is_skill else subagents_data
+        tool_data.setdefault(display_name, [0, 0, 0])[status] = count
 
     # Convert to ToolQuality objects
-    def build_tool_quality(name: str, data: dict) -> ToolQuality:
-        success = data['success']
-        failure = data['failure']
-        incomplete = data['incomplete']
+    def build_tool_quality(name: str, data: list[int]) -> ToolQuality:
+        success, failure, incomplete = data
         total = success + failure + incomplete
 
         # Calculate success rate (only from completed executions)
         completed = success + failure
-        if completed > 0:
-            success_rate = success / completed
-        else:
-            success_rate = 0.0
+        success_rate = success / completed if completed else 0.0
 
         return ToolQuality(
             name=name,
@@ -121,9 +140,9 @@ def analyze_quality(
 
     # Build sorted lists (worst first)
     skills = [build_tool_quality(name, data) for name, data in skills_data.items()]
-    skills.sort(key=lambda x: x.success_rate)
+    skills.sort(key=_by_success_rate)
 
     subagents = [build_tool_quality(name, data) for name, data in subagents_data.items()]
-    subagents.sort(key=lambda x: x.success_rate)
+    subagents.sort(key=_by_success_rate)
 
     return QualityStats(skills=skills, subagents=subagents)
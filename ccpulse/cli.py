@@ -8,7 +8,7 @@ import typer
 
 from . import __version__
 from .analyzer import analyze_quality
-from .display import console, display_quality
+from .display import display_quality, get_console
 from .loader import load_tool_executions
 
 app = typer.Typer(
@@ -20,7 +20,7 @@ app = typer.Typer(
 
 def version_callback(value: bool):
     if value:
-        console.print(f"ccpulse version {__version__}")
+        get_console().print(f"ccpulse version {__version__}")
         raise typer.Exit()
 
 
@@ -139,6 +139,7 @@ def main(
 
         project_filter = get_current_project_dir()
         if project_filter is None:
+            console = get_console()
             console.print("[red]Error: Could not detect current project.[/red]")
             console.print("[yellow]Make sure you're in a directory tracked by Claude Code.[/yellow]")
             raise typer.Exit(1)
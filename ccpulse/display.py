@@ -1,21 +1,21 @@
 """Terminal display using rich library."""
 
+import re
 import sys
 from datetime import datetime
-
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich import box
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from .analyzer import QualityStats, ToolQuality
 
+# rich is imported on first use so that --help and --version start fast
+if TYPE_CHECKING:
+    from rich.console import Console
+
 # Force UTF-8 output on Windows
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
-console = Console(force_terminal=True)
-
 # Colors
 COLOR_PRIMARY = "#E07A5F"
 COLOR_SECONDARY = "#81B29A"
@@ -25,11 +25,22 @@ COLOR_CRITICAL = "#EF4444"    # Red for <50%
 COLOR_WARNING = "#F59E0B"     # Yellow for 50-69%
 COLOR_SUCCESS = "#10B981"     # Green for >=80%
 
+# Relative period labels such as '7d', '2w', '1m'
+_DATE_LABEL_RE = re.compile(r'^\d+[dwm]$')
+
 BAR_CHAR = "█"
 BAR_WIDTH = 10      # Width of the bar chart for success rates
 NAME_MIN_WIDTH = 15 # Minimum width for name column
 
 
+@lru_cache(maxsize=None)
+def get_console() -> "Console":
+    """Get the shared console, creating it on first use."""
+    from rich.console import Console
+
+    return Console(force_terminal=True)
+
+
 def get_rate_color(success_rate: float) -> str:
     """Get color based on success rate."""
     if success_rate < 0.50:
@@ -52,6 +63,10 @@ def display_quality_list(
     bar_width: int,
 ):
     """Display quality metrics as plain text with bars and colors."""
+    from rich.text import Text
+
+    console = get_console()
+    rows: list[tuple[str, str]] = []
     for tool in tools:
         # Format rate percentage
         rate_pct = f"{int(tool.success_rate * 100)}%"
@@ -71,7 +86,17 @@ def display_quality_list(
 
         # Format line
         line = f"{tool.name:<{name_width}} {rate_pct:>4}  {bar:<{bar_width}} {ratio:>6}{incomplete_note}"
-        console.print(f"[{color}]{line}[/]")
+        rows.append((line, color))
+
+    # Render all rows as one Text in a single print. Plain Text skips markup
+    # parsing, so names like "[ccpulse] x" are shown as-is.
+    text = console.highlighter(Text("\n".join(line for line, _ in rows)))
+    offset = 0
+    for line, color in rows:
+        # Row color goes on top of the highlighting, as markup did
+        text.stylize(color, offset, offset + len(line))
+        offset += len(line) + 1
+    console.print(text)
 
 
 def display_quality(
@@ -96,6 +121,11 @@ def display_quality(
         show_subagents: If True, show only subagents
         project_name: Name of the project being analyzed
     """
+    from rich import box
+    from rich.panel import Panel
+
+    console = get_console()
+
     # Determine what to show
     display_skills = not show_subagents  # Show skills unless --subagents is specified
     display_subagents = not show_skills  # Show subagents unless --skills is specified
@@ -113,8 +143,7 @@ def display_quality(
 
     # Parse date label for display
     if date_label:
-        import re
-        if re.match(r'^\d+[dwm]$', date_label.lower()):
+        if _DATE_LABEL_RE.match(date_label.lower()):
             value = int(date_label[:-1])
             unit = date_label[-1].lower()
             unit_map = {'d': 'day', 'w': 'week', 'm': 'month'}
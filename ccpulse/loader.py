@@ -1,14 +1,44 @@
 """JSONL file loader for Claude Code session data."""
 
-import json
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Iterator
+import mmap
 import os
+import pickle
+import re
+import tempfile
 
+# orjson is optional; both decoders accept bytes and raise ValueError subclasses
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
 
-@dataclass
+# Windows-style project directory names, e.g. "C--ccpulse"
+_PROJECT_DIR_RE = re.compile(r'^[A-Z]--(.+)$')
+
+# Claude Code names a project directory after its path with every
+# non-alphanumeric character replaced by '-', e.g. "C:\ccpulse" -> "C--ccpulse"
+_PATH_SEPARATOR_RE = re.compile(r'[^A-Za-z0-9]')
+
+# Below this many files, worker start-up costs more than it saves
+PARALLEL_MIN_FILES = 8
+
+# Files smaller than this are read in one call; mmap setup costs more for them
+MMAP_MIN_SIZE = 1024 * 1024
+
+# Bump when the parsed-file cache layout or parsing rules change
+CACHE_VERSION = 2
+
+# Tools the analyzer reads, and the one tool_input key it reads from each
+_KEPT_INPUT_KEYS = {'Skill': 'skill', 'Task': 'subagent_type'}
+
+
+@dataclass(slots=True)
 class ToolExecution:
     """Represents a tool execution with its result status."""
     timestamp: datetime
@@ -20,13 +50,78 @@ class ToolExecution:
     has_result: bool
 
 
+# Executions by tool_use_id, plus unmatched results (tool_use_id -> is_error)
+FileResult = tuple[dict[str, ToolExecution], dict[str, bool]]
+
+
 def get_claude_projects_dir() -> Path:
     """Get the Claude projects directory path."""
     return Path.home() / ".claude" / "projects"
 
 
+def get_cache_path() -> Path:
+    """Get the path of the parsed-file cache ($XDG_CACHE_HOME or ~/.cache)."""
+    cache_home = os.environ.get('XDG_CACHE_HOME')
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "ccpulse" / "files.pkl"
+
+
+def _load_cache() -> dict[str, tuple[tuple, FileResult]]:
+    """Load the parsed-file cache, or an empty one if missing or unreadable."""
+    try:
+        with open(get_cache_path(), 'rb') as f:
+            data = pickle.load(f)
+        if data.get('version') == CACHE_VERSION:
+            return data['files']
+    except Exception:
+        # Corrupt, truncated or written by an incompatible version
+        pass
+    return {}
+
+
+def _trim_result(file_result: FileResult) -> FileResult:
+    """Keep only what the analyzer needs from a parsed file.
+
+    Inputs of other tools (file contents, shell commands) can be large and
+    sensitive, so they are neither returned nor written to the cache.
+    """
+    file_executions, pending_results = file_result
+    trimmed: dict[str, ToolExecution] = {}
+    for tool_use_id, execution in file_executions.items():
+        key = _KEPT_INPUT_KEYS.get(execution.tool_name)
+        if key is None:
+            continue
+        tool_input = execution.tool_input
+        execution.tool_input = {key: tool_input[key]} if key in tool_input else {}
+        trimmed[tool_use_id] = execution
+    return trimmed, pending_results
+
+
+def _save_cache(files: dict[str, tuple[tuple, FileResult]]) -> None:
+    """Write the parsed-file cache atomically; failures are ignored."""
+    cache_path = get_cache_path()
+    tmp_path = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique per process and created owner-only (0600)
+        fd, tmp_path = tempfile.mkstemp(prefix='files.', suffix='.tmp', dir=cache_path.parent)
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump({'version': CACHE_VERSION, 'files': files}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except (IOError, OSError, pickle.PicklingError):
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+@lru_cache(maxsize=8192)
 def parse_timestamp(ts_str: str) -> datetime:
-    """Parse ISO-8601 timestamp to datetime."""
+    """Parse ISO-8601 timestamp to datetime.
+
+    Cached because the messages of one turn often share a timestamp.
+    """
     if ts_str.endswith('Z'):
         ts_str = ts_str[:-1] + '+00:00'
     return datetime.fromisoformat(ts_str)
@@ -39,8 +134,7 @@ def extract_project_name(project_dir_name: str) -> str:
         C--ccpulse -> ccpulse
         C--Users-jkmo2 -> Users-jkmo2
     """
-    import re
-    match = re.match(r'^[A-Z]--(.+)$', project_dir_name)
+    match = _PROJECT_DIR_RE.match(project_dir_name)
     if match:
         return match.group(1)
     return project_dir_name
@@ -54,7 +148,12 @@ def get_current_project_dir() -> str | None:
     if not projects_dir.exists():
         return None
 
-    # Match cwd basename against project names
+    # Fast path: the directory Claude Code would have created for cwd
+    encoded = _PATH_SEPARATOR_RE.sub('-', str(cwd))
+    if (projects_dir / encoded).is_dir():
+        return encoded
+
+    # Fall back to matching cwd basename against project names
     for project_dir in projects_dir.iterdir():
         if not project_dir.is_dir():
             continue
@@ -68,6 +167,139 @@ def get_current_project_dir() -> str | None:
     return None
 
 
+@contextmanager
+def _open_buffer(path: Path) -> Iterator[bytes | mmap.mmap]:
+    """Open a file as a bytes-like buffer without any text decoding layer."""
+    # Unbuffered: the whole file is consumed at once, so skip BufferedReader
+    with open(path, 'rb', buffering=0) as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+            yield f.readall()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _iter_tool_lines(buf: bytes | mmap.mmap) -> Iterator[bytes]:
+    """Yield the lines of buf that mention a "tool_..." string.
+
+    Searching for the token first lets the bytes.find/mmap.find C loop skip
+    plain conversation lines without creating a line object for each one.
+    """
+    pos = 0
+    size = len(buf)
+    while pos < size:
+        hit = buf.find(b'"tool_', pos)
+        if hit < 0:
+            return
+        newline = buf.rfind(b'\n', pos, hit)
+        start = newline + 1 if newline >= 0 else pos
+        end = buf.find(b'\n', hit)
+        if end < 0:
+            end = size
+        yield buf[start:end]
+        pos = end + 1
+
+
+def _parse_file(
+    jsonl_file: Path,
+    project_name: str,
+    start_date: datetime,
+    end_date: datetime,
+) -> FileResult:
+    """Extract tool executions from a single session file.
+
+    Runs in a worker process, so it only depends on its arguments.
+
+    Returns:
+        Tuple of (Skill/Task executions by tool_use_id, unmatched results) where
+        unmatched results map tool_use_id -> is_error for tool_results whose
+        tool_use was not found in this file.
+    """
+    executions_dict: dict[str, ToolExecution] = {}
+    # tool_result entries seen before their tool_use (tool_use_id -> is_error)
+    pending_results: dict[str, bool] = {}
+
+    # Second-precision UTC bounds; "...Z" timestamps sort lexicographically
+    start_str = start_date.astimezone(timezone.utc).isoformat(timespec='seconds')[:19]
+    end_str = end_date.astimezone(timezone.utc).isoformat(timespec='seconds')[:19]
+
+    try:
+        with _open_buffer(jsonl_file) as buf:
+            for line in _iter_tool_lines(buf):
+                # Cheap substring check before paying for a full JSON parse
+                if b'"tool_use"' not in line and b'"tool_result"' not in line:
+                    continue
+                try:
+                    data = loads(line)
+                    # Decoders return exact builtin types, so skip the isinstance MRO walk
+                    if type(data) is not dict:
+                        continue
+                    entry_type = data.get('type')
+
+                    if entry_type == 'assistant':
+                        ts_str = data.get('timestamp')
+                        if not ts_str:
+                            continue
+
+                        # Reject out-of-range UTC timestamps with a string compare
+                        if ts_str[-1:] == 'Z' and (ts_str[:19] < start_str or ts_str[:19] > end_str):
+                            continue
+
+                        timestamp = parse_timestamp(ts_str)
+
+                        # Filter by date range
+                        if timestamp < start_date or timestamp > end_date:
+                            continue
+
+                        message = data.get('message')
+                        content = message.get('content') if message else None
+
+                        if type(content) is list:
+                            for item in content:
+                                if type(item) is dict and item.get('type') == 'tool_use':
+                                    tool_use_id = item.get('id')
+                                    if tool_use_id:
+                                        execution = ToolExecution(
+                                            timestamp=timestamp,
+                                            tool_name=item.get('name', ''),
+                                            tool_input=item.get('input') or {},
+                                            project=project_name,
+                                            tool_use_id=tool_use_id,
+                                            is_error=None,
+                                            has_result=False,
+                                        )
+                                        # Result may have been logged before the tool_use
+                                        if tool_use_id in pending_results:
+                                            execution.has_result = True
+                                            execution.is_error = pending_results.pop(tool_use_id)
+                                        executions_dict[tool_use_id] = execution
+
+                    elif entry_type == 'user':
+                        message = data.get('message')
+                        content = message.get('content') if message else None
+
+                        if type(content) is list:
+                            for item in content:
+                                if type(item) is dict and item.get('type') == 'tool_result':
+                                    tool_use_id = item.get('tool_use_id')
+                                    if not tool_use_id:
+                                        continue
+                                    # Default to False if is_error field missing
+                                    is_error = item.get('is_error', False)
+                                    if tool_use_id in executions_dict:
+                                        execution = executions_dict[tool_use_id]
+                                        execution.has_result = True
+                                        execution.is_error = is_error
+                                    else:
+                                        pending_results[tool_use_id] = is_error
+                except ValueError:
+                    continue
+    except (IOError, OSError):
+        return {}, {}
+
+    return _trim_result((executions_dict, pending_results))
+
+
 def load_tool_executions(
     start_date: datetime | None = None,
     end_date: datetime | None = None,
@@ -75,7 +307,10 @@ def load_tool_executions(
 ) -> list[ToolExecution]:
     """Load tool executions from Claude projects directory within date range.
 
-    Uses two-pass parsing to correlate tool_use with tool_result entries.
+    Reads each file once, correlating tool_use with tool_result entries as
+    they are seen (results logged before their tool_use are buffered).
+    Only Skill and Task executions are returned, with tool_input trimmed to
+    the key the analyzer reads (skill or subagent_type).
 
     Args:
         start_date: Start date (inclusive). If None, defaults to today at 00:00:00.
@@ -102,8 +337,11 @@ def load_tool_executions(
         start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=timezone.utc)
         end_date = end_date.replace(hour=23, minute=59, second=59, microsecond=999999, tzinfo=timezone.utc)
 
-    # Two-pass parsing: Pass 1 - Build dict of executions from tool_use
-    executions_dict: dict[str, ToolExecution] = {}
+    cache = _load_cache()
+
+    # Per-file results in scan order; None marks a file that must be parsed
+    results: list[FileResult | None] = []
+    misses: list[tuple[int, Path, str, tuple]] = []
 
     for project_dir in projects_dir.iterdir():
         if not project_dir.is_dir():
@@ -118,82 +356,75 @@ def load_tool_executions(
 
         for jsonl_file in project_dir.glob('*.jsonl'):
             try:
-                # Quick filter: skip files modified before start_date
-                file_mtime = datetime.fromtimestamp(os.path.getmtime(jsonl_file), tz=timezone.utc)
-                if file_mtime < start_date:
-                    continue
-
-                # Pass 1: Extract tool_use entries
-                with open(jsonl_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                        try:
-                            data = json.loads(line)
-                            ts_str = data.get('timestamp')
-                            if not ts_str:
-                                continue
-
-                            timestamp = parse_timestamp(ts_str)
-
-                            # Filter by date range
-                            if timestamp < start_date or timestamp > end_date:
-                                continue
-
-                            # Only process assistant messages
-                            if data.get('type') != 'assistant':
-                                continue
-
-                            message = data.get('message', {})
-                            content = message.get('content', [])
-
-                            if isinstance(content, list):
-                                for item in content:
-                                    if isinstance(item, dict) and item.get('type') == 'tool_use':
-                                        tool_use_id = item.get('id', '')
-                                        if tool_use_id:
-                                            executions_dict[tool_use_id] = ToolExecution(
-                                                timestamp=timestamp,
-                                                tool_name=item.get('name', ''),
-                                                tool_input=item.get('input', {}),
-                                                project=project_name,
-                                                tool_use_id=tool_use_id,
-                                                is_error=None,
-                                                has_result=False,
-                                            )
-                        except (json.JSONDecodeError, ValueError):
-                            continue
-
-                # Pass 2: Update with tool_result entries
-                with open(jsonl_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                        try:
-                            data = json.loads(line)
-
-                            # Only process user messages
-                            if data.get('type') != 'user':
-                                continue
-
-                            message = data.get('message', {})
-                            content = message.get('content', [])
-
-                            if isinstance(content, list):
-                                for item in content:
-                                    if isinstance(item, dict) and item.get('type') == 'tool_result':
-                                        tool_use_id = item.get('tool_use_id', '')
-                                        if tool_use_id and tool_use_id in executions_dict:
-                                            execution = executions_dict[tool_use_id]
-                                            execution.has_result = True
-                                            # Default to False if is_error field missing
-                                            execution.is_error = item.get('is_error', False)
-                        except (json.JSONDecodeError, ValueError):
-                            continue
-
+                st = jsonl_file.stat()
             except (IOError, OSError):
                 continue
 
+            # Quick filters: skip empty files and files modified before start_date
+            if st.st_size == 0:
+                continue
+            file_mtime = datetime.fromtimestamp(st.st_mtime, tz=timezone.utc)
+            if file_mtime < start_date:
+                continue
+
+            # Reuse the cached result if the file is unchanged and the range matches
+            cache_key = (st.st_mtime_ns, st.st_size, start_date, end_date)
+            cached = cache.get(str(jsonl_file))
+            if cached is not None and cached[0] == cache_key:
+                results.append(cached[1])
+            else:
+                misses.append((len(results), jsonl_file, project_name, cache_key))
+                results.append(None)
+
+    # Files are independent until the merge, so parse them in parallel
+    parse = partial(_parse_file, start_date=start_date, end_date=end_date)
+    paths = [path for _, path, _, _ in misses]
+    project_names = [name for _, _, name, _ in misses]
+
+    parsed = None
+    if len(misses) >= PARALLEL_MIN_FILES:
+        # Imported here: multiprocessing is slow to import and rarely needed
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        workers = min(os.cpu_count() or 1, len(misses))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed = list(executor.map(
+                    parse, paths, project_names,
+                    chunksize=max(1, len(misses) // (workers * 4)),
+                ))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # No process support (e.g. missing POSIX semaphores) or a worker died
+            parsed = None
+    if parsed is None:
+        parsed = list(map(parse, paths, project_names))
+
+    for (index, path, _, cache_key), file_result in zip(misses, parsed):
+        results[index] = file_result
+        cache[str(path)] = (cache_key, file_result)
+
+    # Evict deleted or renamed files; entries outside this scan are kept
+    stale = [path for path in cache if not os.path.exists(path)]
+    for path in stale:
+        del cache[path]
+
+    if misses or stale:
+        _save_cache(cache)
+
+    # Merge in file order
+    executions_dict: dict[str, ToolExecution] = {}
+    for file_executions, _ in results:
+        executions_dict.update(file_executions)
+
+    # Reconcile results whose tool_use was loaded from another file
+    for _, pending_results in results:
+        for tool_use_id, is_error in pending_results.items():
+            if tool_use_id in executions_dict:
+                execution = executions_dict[tool_use_id]
+                execution.has_result = True
+                execution.is_error = is_error
+
     # Convert dict to sorted list
     executions = list(executions_dict.values())
     executions.sort(key=lambda x: x.timestamp)